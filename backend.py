@@ -2,25 +2,60 @@
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-import random
+from contextlib import asynccontextmanager
+import asyncio
+import heapq
+import os
+import time
+import anyio
 import numpy as np
+import orjson
+
+THREADPOOL_SIZE = 100
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup: perbesar threadpool dan bangun dokumen OpenAPI sebelum request pertama"""
+    # Threadpool lebih besar untuk pembangunan response yang CPU-bound
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    app.openapi()
+    yield
 
 app = FastAPI(
     title="KCI Stasiun BNI City",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Origin frontend yang diizinkan, dipisah koma (contoh: "https://kci.example,http://localhost:3000").
+# Di production (APP_ENV=production, di-set oleh deploy CI) wajib diisi: default localhost
+# tidak akan cocok dengan origin frontend sehingga browser menolak semua response.
+if os.getenv("APP_ENV") == "production" and not os.getenv("CORS_ORIGINS", "").strip():
+    raise RuntimeError("CORS_ORIGINS must be set when APP_ENV=production")
+
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8501").split(",")
+    if origin.strip()
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET",),
+    allow_headers=("*",),
 )
 
+# Payload JSON berisi banyak key berulang, sangat mudah dikompres
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 
 class TrafficHourData(BaseModel):
     hour: int
@@ -150,24 +185,174 @@ class BehaviorCorrelationResponse(BaseModel):
     occupation_zone_preference: List[OccupationZonePreferenceData]
     summary: Dict
 
+# ==========================
+# STATIC METADATA
+# ==========================
+
+# Jam operasional 06:00-22:00
+HOURS = np.arange(6, 23)
+_MORNING_PEAK = (HOURS >= 7) & (HOURS <= 9)
+_EVENING_PEAK = (HOURS >= 16) & (HOURS <= 19)
+TRAFFIC_PERIODS = tuple(
+    "Morning Peak" if morning else "Evening Peak" if evening else ""  # Empty label untuk off-peak
+    for morning, evening in zip(_MORNING_PEAK, _EVENING_PEAK)
+)
+_TRAFFIC_LOW = np.where(_MORNING_PEAK | _EVENING_PEAK, 400, 50)
+_TRAFFIC_HIGH = np.where(_MORNING_PEAK | _EVENING_PEAK, 601, 201)
+# Base proporsi pria per jam: pagi 55%, sore 45%, selainnya ~50%
+_PRIA_BASE = np.where(HOURS <= 11, 0.55, np.where(_EVENING_PEAK, 0.45, 0.50))
+# Bucket pola gender per jam (0-23): pagi 06-11, sore 16-19, selainnya None
+_HOUR_BUCKET = tuple("morning" if 6 <= h <= 11 else "evening" if 16 <= h <= 19 else None for h in range(24))
+
+# 8 gates: 4 North, 4 West
+GATE_ZONES = ('North',) * 4 + ('West',) * 4
+GATE_IDS = tuple(f"TAP-{zone.upper()}-00{i}" for zone in ('North', 'West') for i in range(1, 5))
+_NORTH_GATES = np.array(GATE_ZONES) == 'North'
+_GATE_LOW = np.array([450] * 4 + [400] * 4)
+_GATE_HIGH = np.array([651] * 4 + [601] * 4)
+
+AGE_LABELS = ('18-24', '25-34', '35-44', '45-54', '55+')
+AGE_MIDPOINTS = np.array([21, 29.5, 39.5, 49.5, 60])  # 55+ dihitung 60
+AGE_AVG = round(float(AGE_MIDPOINTS.mean()), 1)
+_AGE_LOW = np.array([300, 800, 1000, 700, 200])
+_AGE_HIGH = np.array([501, 1201, 1501, 1001, 401])
+_PRODUCTIVE_AGES = np.isin(AGE_LABELS, ('25-34', '35-44'))
+
+OCCUPATIONS = ('Karyawan Swasta', 'PNS/BUMN', 'Pelajar/Mahasiswa', 'Wiraswasta', 'Wisatawan')
+_OCCUPATION_LOW = np.array([1500, 600, 400, 500, 100])
+_OCCUPATION_HIGH = np.array([2201, 901, 701, 801, 301])
+_OCCUPATION_FREQ_LOW, _OCCUPATION_FREQ_HIGH = np.array([
+    (8.0, 10.0), (8.5, 10.5), (5.0, 7.0), (6.0, 8.0), (2.0, 4.0)
+]).T
+_WORKER_OCCUPATIONS = np.isin(OCCUPATIONS, ('Karyawan Swasta', 'PNS/BUMN'))
+
+STATIONS = (
+    'Bekasi', 'Cikarang', 'Depok', 'Bogor', 'Tangerang',
+    'Sudirman', 'Karet', 'Pasar Minggu', 'Tanah Abang'
+)
+_STATION_LOW = np.array([700, 400, 500, 400, 300, 300, 300, 100, 200])
+_STATION_HIGH = np.array([1001, 601, 701, 601, 501, 501, 501, 301, 401])
+
+# Usia vs base frekuensi loyalty
+# Pola: usia lebih tinggi cenderung lebih loyal
+AGE_LOYALTY_GROUPS = (
+    (22, 6.5),  # Usia muda (22-28)
+    (28, 7.2),  # Young adult (29-35)
+    (35, 8.5),  # Mid adult (36-45)
+    (45, 9.0),  # Mature (46-55)
+    (55, 7.0)   # Senior (56+)
+)
+_LOYALTY_AGES = tuple(age for age, _ in AGE_LOYALTY_GROUPS)
+_LOYALTY_BASE_FREQ = np.array([base_freq for _, base_freq in AGE_LOYALTY_GROUPS])
+
+# Rasio North/West per pekerjaan
+# Pola: PNS/BUMN prefer North (dekat kantor), Wisatawan prefer West (dekat area komersial)
+OCCUPATION_ZONE_RATIOS = (
+    (0.52, 0.48),  # Karyawan Swasta: sedikit prefer North
+    (0.60, 0.40),  # PNS/BUMN: jelas prefer North
+    (0.48, 0.52),  # Pelajar/Mahasiswa: sedikit prefer West
+    (0.50, 0.50),  # Wiraswasta: seimbang
+    (0.35, 0.65)   # Wisatawan: prefer West (area komersial)
+)
+_NORTH_RATIOS = np.array([north_ratio for north_ratio, _ in OCCUPATION_ZONE_RATIOS])
+OCCUPATION_ZONE_PREFERENCES = tuple(
+    'North' if north_ratio > 0.55 else 'West' if west_ratio > 0.55 else 'Neutral'
+    for north_ratio, west_ratio in OCCUPATION_ZONE_RATIOS
+)
+
 # ==========================
 # DATA GENERATION HELPERS
 # ==========================
 
+RNG = np.random.default_rng()
+
+def apply_variance(base: np.ndarray, variance=0.2) -> np.ndarray:
+    """Apply random daily variance to an array of base values (variance may be per element)"""
+    return (base * (1 + RNG.uniform(-variance, variance, size=base.shape))).astype(np.int64)
+
 def generate_daily_data(base_value: int, variance: float = 0.2) -> int:
-    """Generate random daily data with variance"""
-    return int(base_value * (1 + random.uniform(-variance, variance)))
+    """Generate random daily data with variance (scalar version of apply_variance)"""
+    return int(base_value * (1 + RNG.uniform(-variance, variance)))
+
+def to_percentages(counts: np.ndarray, total: float, decimals: int = 1) -> list:
+    """Convert counts to rounded percentages of total"""
+    return np.round(counts * (100.0 / total), decimals).tolist()
+
+def station_distribution(total: int) -> Tuple[np.ndarray, list]:
+    """Generate origin station counts and their percentages of total"""
+    counts = apply_variance(RNG.integers(_STATION_LOW, _STATION_HIGH), 0.2)
+    return counts, to_percentages(counts, total)
+
+_today_cache = ["", 0.0]  # [tanggal, berlaku sampai (epoch detik)]
 
 def get_date() -> str:
-    """Get current date string"""
-    return datetime.now().strftime("%Y-%m-%d")
+    """Get current date string, cached until local midnight"""
+    now = time.time()
+    if now >= _today_cache[1]:
+        today = datetime.fromtimestamp(now)
+        midnight = datetime.combine(today.date() + timedelta(days=1), datetime.min.time())
+        _today_cache[0] = today.strftime("%Y-%m-%d")
+        _today_cache[1] = midnight.timestamp()
+    return _today_cache[0]
+
+# ==========================
+# RESPONSE CACHE
+# ==========================
+
+# Cache per-proses: dengan beberapa worker (gunicorn.conf.py) tiap worker menyimpan
+# salinannya sendiri. Pindahkan ke Redis jika response harus sama antar worker.
+
+CACHE_TTL_SECONDS = 60
+CACHE_MAX_ENTRIES = 256
+
+_cache: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+_cache_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+# Body JSON /all-data yang sudah di-encode, per tanggal
+_all_data_cache: Dict[str, Tuple[float, bytes]] = {}
+
+def _evict_expired(cache: dict, now: float) -> list:
+    """Drop expired entries, then the oldest live ones until the cache is under CACHE_MAX_ENTRIES"""
+    evicted = [key for key, (created, _) in cache.items() if now - created >= CACHE_TTL_SECONDS]
+    for key in evicted:
+        del cache[key]
+    # `date` bebas diisi client: tanpa batas ini tanggal acak menumpuk selama satu TTL.
+    # Dict menyimpan urutan insert, jadi key pertama adalah entry tertua.
+    while len(cache) >= CACHE_MAX_ENTRIES:
+        key = next(iter(cache))
+        del cache[key]
+        evicted.append(key)
+    return evicted
+
+async def get_cached(endpoint: str, target_date: str, build: Callable[[str], dict]) -> dict:
+    """Return cached response for (endpoint, date), rebuild once per TTL"""
+    key = (endpoint, target_date)
+    entry = _cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < CACHE_TTL_SECONDS:
+        return entry[1]
+
+    # Satu lock per key agar request bersamaan tidak membangun response yang sama
+    lock = _cache_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        entry = _cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < CACHE_TTL_SECONDS:
+            return entry[1]
+
+        # Generator data murni CPU-bound, jalankan di threadpool agar event loop tetap bebas
+        response = await anyio.to_thread.run_sync(build, target_date)
+        _cache.pop(key, None)  # insert ulang di akhir agar urutan dict tetap urutan umur
+        if len(_cache) >= CACHE_MAX_ENTRIES:
+            for evicted in _evict_expired(_cache, now):
+                _cache_locks.pop(evicted, None)
+        _cache[key] = (now, response)
+        return response
 
 # ==========================
 # ENDPOINTS - KATEGORI 1: OPERATIONAL EFFICIENCY
 # ==========================
 
-@app.get("/api/v1/operational-efficiency", response_model=OperationalEfficiencyResponse, include_in_schema=False)
-async def get_operational_efficiency(date: Optional[str] = None):
+def _build_operational_efficiency(target_date: str) -> dict:
     """
     Kategori 1: Operational Efficiency
     - 1.1 Traffic per Jam
@@ -175,82 +360,54 @@ async def get_operational_efficiency(date: Optional[str] = None):
     - 1.3 Traffic by Zone
     - 1.4 Balance Direction
     """
-    target_date = date or get_date()
-
     # Random daily total transactions (4000-6000)
-    total_transactions = random.randint(4000, 6000)
-
-
-    traffic_per_hour = []
-    for hour in range(6, 23):
-        # Morning peak (7-9) higher, Evening peak (16-19) higher, Off-peak tanpa label
-        if 7 <= hour <= 9:
-            base_count = random.randint(400, 600)
-            period = "Morning Peak"
-        elif 16 <= hour <= 19:
-            base_count = random.randint(400, 600)
-            period = "Evening Peak"
-        else:
-            base_count = random.randint(50, 200)
-            period = ""  # Empty label untuk off-peak (tidak ditampilkan)
+    total_transactions = int(RNG.integers(4000, 6001))
 
-        count = generate_daily_data(base_count, 0.15)
-        traffic_per_hour.append(TrafficHourData(
-            hour=hour,
-            count=count,
-            period=period
-        ))
+    # 1.1 Traffic per Jam (Morning peak 7-9 dan Evening peak 16-19 lebih tinggi)
+    hour_counts = apply_variance(RNG.integers(_TRAFFIC_LOW, _TRAFFIC_HIGH), 0.15)
+    traffic_per_hour = [
+        {"hour": hour, "count": count, "period": period}
+        for hour, count, period in zip(HOURS.tolist(), hour_counts.tolist(), TRAFFIC_PERIODS)
+    ]
 
     # 1.2 Gate Utilization (8 gates: 4 North, 4 West)
-    gate_utilization = []
-    zones = ['North', 'West']
-    for zone in zones:
-        for i in range(1, 5):
-            gate_id = f"TAP-{zone.upper()}-00{i}"
-            base_count = random.randint(450, 650) if zone == 'North' else random.randint(400, 600)
-            count = generate_daily_data(base_count, 0.2)
-            utilization_rate = (count / total_transactions) * 100
-            gate_utilization.append(GateUtilizationData(
-                gate_id=gate_id,
-                zone=zone,
-                count=count,
-                utilization_rate=round(utilization_rate, 2)
-            ))
+    gate_counts = apply_variance(RNG.integers(_GATE_LOW, _GATE_HIGH), 0.2)
+    gate_rates = to_percentages(gate_counts, total_transactions, 2)
+    gate_utilization = [
+        {"gate_id": gate_id, "zone": zone, "count": count, "utilization_rate": rate}
+        for gate_id, zone, count, rate in zip(GATE_IDS, GATE_ZONES, gate_counts.tolist(), gate_rates)
+    ]
 
     # 1.3 Traffic by Zone
-    north_count = sum(g.count for g in gate_utilization if g.zone == 'North')
-    west_count = sum(g.count for g in gate_utilization if g.zone == 'West')
+    north_count = int(gate_counts[_NORTH_GATES].sum())
+    west_count = int(gate_counts[~_NORTH_GATES].sum())
+    north_pct, west_pct = to_percentages(np.array([north_count, west_count]), total_transactions)
     traffic_by_zone = [
-        TrafficZoneData(
-            zone='TAP-NORTH',
-            count=north_count,
-            percentage=round((north_count / total_transactions) * 100, 1)
-        ),
-        TrafficZoneData(
-            zone='TAP-WEST',
-            count=west_count,
-            percentage=round((west_count / total_transactions) * 100, 1)
-        )
+        {"zone": 'TAP-NORTH', "count": north_count, "percentage": north_pct},
+        {"zone": 'TAP-WEST', "count": west_count, "percentage": west_pct}
     ]
 
-    # 1.4 Balance Direction per Zone
-    balance_direction = []
-    for zone_data in traffic_by_zone:
-        zone_name = zone_data.zone.replace('TAP-', '')
-        for direction in ['IN', 'OUT']:
-            count = int(zone_data.count * random.uniform(0.45, 0.55))
-            percentage = round((count / zone_data.count) * 100, 1)
-            balance_direction.append(DirectionBalanceData(
-                zone=zone_name,
-                direction=direction,
-                count=count,
-                percentage=percentage
-            ))
+    # 1.4 Balance Direction per Zone (OUT = sisa dari IN, jadi IN + OUT selalu 100%)
+    zone_counts = np.array([north_count, west_count])
+    in_counts = (zone_counts * RNG.uniform(0.45, 0.55, zone_counts.size)).astype(np.int64)
+    out_counts = zone_counts - in_counts
+    in_pct = np.round(in_counts * 100.0 / zone_counts, 1)
+    out_pct = np.round(100.0 - in_pct, 1)
+    balance_direction = [
+        row
+        for zone, in_count, out_count, in_p, out_p in zip(
+            ('NORTH', 'WEST'), in_counts.tolist(), out_counts.tolist(), in_pct.tolist(), out_pct.tolist()
+        )
+        for row in (
+            {"zone": zone, "direction": 'IN', "count": in_count, "percentage": in_p},
+            {"zone": zone, "direction": 'OUT', "count": out_count, "percentage": out_p}
+        )
+    ]
 
     # Summary
-    morning_peak = sum(t.count for t in traffic_per_hour if 7 <= t.hour <= 9)
-    evening_peak = sum(t.count for t in traffic_per_hour if 16 <= t.hour <= 19)
-    avg_gate_util = sum(g.utilization_rate for g in gate_utilization) / len(gate_utilization)
+    morning_peak = int(hour_counts[_MORNING_PEAK].sum())
+    evening_peak = int(hour_counts[_EVENING_PEAK].sum())
+    avg_gate_util = float(np.mean(gate_rates))
 
     summary = {
         "morning_peak_transactions": morning_peak,
@@ -258,27 +415,33 @@ async def get_operational_efficiency(date: Optional[str] = None):
         "evening_peak_transactions": evening_peak,
         "evening_peak_percentage": round((evening_peak / total_transactions) * 100, 1),
         "avg_gate_utilization_rate": round(avg_gate_util, 2),
-        "busiest_gate": max(gate_utilization, key=lambda x: x.count).gate_id,
-        "busiest_zone": max(traffic_by_zone, key=lambda x: x.count).zone
+        "busiest_gate": GATE_IDS[int(gate_counts.argmax())],
+        "busiest_zone": 'TAP-NORTH' if north_count >= west_count else 'TAP-WEST'
     }
 
-    return OperationalEfficiencyResponse(
-        date=target_date,
-        total_transactions=total_transactions,
-        traffic_per_hour=traffic_per_hour,
-        gate_utilization=gate_utilization,
-        traffic_by_zone=traffic_by_zone,
-        balance_direction=balance_direction,
-        summary=summary
-    )
+    return {
+        "date": target_date,
+        "total_transactions": total_transactions,
+        "traffic_per_hour": traffic_per_hour,
+        "gate_utilization": gate_utilization,
+        "traffic_by_zone": traffic_by_zone,
+        "balance_direction": balance_direction,
+        "summary": summary
+    }
+
+
+@app.get("/api/v1/operational-efficiency", response_model=None, include_in_schema=False)
+async def get_operational_efficiency(date: Optional[str] = None):
+    """Kategori 1: Operational Efficiency"""
+    result = await get_cached("operational-efficiency", date or get_date(), _build_operational_efficiency)
+    return ORJSONResponse(result)
 
 
 # ==========================
 # ENDPOINTS - KATEGORI 3: PROFIL DEMOGRAFI PENUMPANG
 # ==========================
 
-@app.get("/api/v1/demografi", response_model=DemografiResponse, include_in_schema=False)
-async def get_demografi(date: Optional[str] = None):
+def _build_demografi(target_date: str) -> dict:
     """
     Kategori 3: Profil Demografi Penumpang
     - 3.1 Distribusi Usia
@@ -286,427 +449,411 @@ async def get_demografi(date: Optional[str] = None):
     - 3.3 Distribusi Jenis Kelamin
     - 3.4 Distribusi Stasiun Asal
     """
-    target_date = date or get_date()
-
     # Random daily total passengers
-    total_passengers = random.randint(3500, 5000)
+    total_passengers = int(RNG.integers(3500, 5001))
 
     # 3.1 Distribusi Usia
-    age_ranges = [
-        ('18-24', random.randint(300, 500)),
-        ('25-34', random.randint(800, 1200)),
-        ('35-44', random.randint(1000, 1500)),
-        ('45-54', random.randint(700, 1000)),
-        ('55+', random.randint(200, 400))
+    age_counts = apply_variance(RNG.integers(_AGE_LOW, _AGE_HIGH), 0.1)
+    age_distribution = [
+        {"age_range": age_range, "count": count, "percentage": pct}
+        for age_range, count, pct in zip(
+            AGE_LABELS, age_counts.tolist(), to_percentages(age_counts, total_passengers)
+        )
     ]
-    age_distribution = []
-    for age_range, base_count in age_ranges:
-        count = generate_daily_data(base_count, 0.1)
-        age_distribution.append(AgeDistributionData(
-            age_range=age_range,
-            count=count,
-            percentage=round((count / total_passengers) * 100, 1)
-        ))
 
     # 3.2 Distribusi Pekerjaan
-    occupations = [
-        ('Karyawan Swasta', random.randint(1500, 2200)),
-        ('PNS/BUMN', random.randint(600, 900)),
-        ('Pelajar/Mahasiswa', random.randint(400, 700)),
-        ('Wiraswasta', random.randint(500, 800)),
-        ('Wisatawan', random.randint(100, 300))
+    occupation_counts = apply_variance(RNG.integers(_OCCUPATION_LOW, _OCCUPATION_HIGH), 0.15)
+    occupation_distribution = [
+        {"occupation": occupation, "count": count, "percentage": pct}
+        for occupation, count, pct in zip(
+            OCCUPATIONS, occupation_counts.tolist(), to_percentages(occupation_counts, total_passengers)
+        )
     ]
-    occupation_distribution = []
-    for occupation, base_count in occupations:
-        count = generate_daily_data(base_count, 0.15)
-        occupation_distribution.append(OccupationDistributionData(
-            occupation=occupation,
-            count=count,
-            percentage=round((count / total_passengers) * 100, 1)
-        ))
 
     # 3.3 Distribusi Jenis Kelamin
     pria_count = generate_daily_data(int(total_passengers * 0.52), 0.05)
     wanita_count = total_passengers - pria_count
+    pria_pct, wanita_pct = to_percentages(np.array([pria_count, wanita_count]), total_passengers)
     gender_distribution = [
-        GenderDistributionData(
-            gender='Pria',
-            count=pria_count,
-            percentage=round((pria_count / total_passengers) * 100, 1)
-        ),
-        GenderDistributionData(
-            gender='Wanita',
-            count=wanita_count,
-            percentage=round((wanita_count / total_passengers) * 100, 1)
-        )
+        {"gender": 'Pria', "count": pria_count, "percentage": pria_pct},
+        {"gender": 'Wanita', "count": wanita_count, "percentage": wanita_pct}
     ]
 
     # 3.4 Distribusi Stasiun Asal
-    stations = [
-        ('Bekasi', random.randint(700, 1000)),
-        ('Cikarang', random.randint(400, 600)),
-        ('Depok', random.randint(500, 700)),
-        ('Bogor', random.randint(400, 600)),
-        ('Tangerang', random.randint(300, 500)),
-        ('Sudirman', random.randint(300, 500)),
-        ('Karet', random.randint(300, 500)),
-        ('Pasar Minggu', random.randint(100, 300)),
-        ('Tanah Abang', random.randint(200, 400))
+    station_counts, station_pct = station_distribution(total_passengers)
+    origin_station_distribution = [
+        {"station": station, "count": count, "percentage": pct}
+        for station, count, pct in zip(STATIONS, station_counts.tolist(), station_pct)
     ]
-    origin_station_distribution = []
-    for station, base_count in stations:
-        count = generate_daily_data(base_count, 0.2)
-        origin_station_distribution.append(OriginStationData(
-            station=station,
-            count=count,
-            percentage=round((count / total_passengers) * 100, 1)
-        ))
 
     # Summary
-    avg_age = sum(
-        (int(age_range.split('-')[0]) + int(age_range.split('-')[1])) / 2
-        if '-' in age_range else 60
-        for age_range, _ in age_ranges
-    ) / len(age_ranges)
-
-    productive_age = sum(a.count for a in age_distribution if a.age_range in ['25-34', '35-44'])
-    workers = sum(o.count for o in occupation_distribution if o.occupation in ['Karyawan Swasta', 'PNS/BUMN'])
+    productive_age = int(age_counts[_PRODUCTIVE_AGES].sum())
+    workers = int(occupation_counts[_WORKER_OCCUPATIONS].sum())
 
     summary = {
-        "average_age": round(avg_age, 1),
+        "average_age": AGE_AVG,
         "productive_age_passengers": productive_age,
         "productive_age_percentage": round((productive_age / total_passengers) * 100, 1),
         "worker_passengers": workers,
         "worker_percentage": round((workers / total_passengers) * 100, 1),
-        "dominant_origin_station": max(origin_station_distribution, key=lambda x: x.count).station
+        "dominant_origin_station": STATIONS[int(station_counts.argmax())]
     }
 
-    return DemografiResponse(
-        date=target_date,
-        total_passengers=total_passengers,
-        age_distribution=age_distribution,
-        occupation_distribution=occupation_distribution,
-        gender_distribution=gender_distribution,
-        origin_station_distribution=origin_station_distribution,
-        summary=summary
-    )
+    return {
+        "date": target_date,
+        "total_passengers": total_passengers,
+        "age_distribution": age_distribution,
+        "occupation_distribution": occupation_distribution,
+        "gender_distribution": gender_distribution,
+        "origin_station_distribution": origin_station_distribution,
+        "summary": summary
+    }
+
+
+@app.get("/api/v1/demografi", response_model=None, include_in_schema=False)
+async def get_demografi(date: Optional[str] = None):
+    """Kategori 3: Profil Demografi Penumpang"""
+    result = await get_cached("demografi", date or get_date(), _build_demografi)
+    return ORJSONResponse(result)
 
 
 # ==========================
 # ENDPOINTS - KATEGORI 4: SEGMENTASI PERJALANAN
 # ==========================
 
-@app.get("/api/v1/segmentasi-perjalanan", response_model=SegmentasiPerjalananResponse, include_in_schema=False)
-async def get_segmentasi_perjalanan(date: Optional[str] = None):
+def _build_segmentasi_perjalanan(target_date: str) -> dict:
     """
     Kategori 4: Segmentasi Perjalanan
     - 4.1 Distribusi Stasiun Awal
     - 4.2 Direction Distribution
     - 4.3 Waktu Perjalanan
     """
-    target_date = date or get_date()
-
     # Random daily total transactions
-    total_transactions = random.randint(4000, 6000)
+    total_transactions = int(RNG.integers(4000, 6001))
 
     # 4.1 Distribusi Stasiun Awal
-    stations = [
-        ('Bekasi', random.randint(700, 1000)),
-        ('Cikarang', random.randint(400, 600)),
-        ('Depok', random.randint(500, 700)),
-        ('Bogor', random.randint(400, 600)),
-        ('Tangerang', random.randint(300, 500)),
-        ('Sudirman', random.randint(300, 500)),
-        ('Karet', random.randint(300, 500)),
-        ('Pasar Minggu', random.randint(100, 300)),
-        ('Tanah Abang', random.randint(200, 400))
+    station_counts, station_pct = station_distribution(total_transactions)
+    origin_distribution = [
+        {"station": station, "count": count, "percentage": pct}
+        for station, count, pct in zip(STATIONS, station_counts.tolist(), station_pct)
     ]
-    origin_distribution = []
-    for station, base_count in stations:
-        count = generate_daily_data(base_count, 0.2)
-        origin_distribution.append(OriginDistributionData(
-            station=station,
-            count=count,
-            percentage=round((count / total_transactions) * 100, 1)
-        ))
 
     # 4.2 Direction Distribution (IN vs OUT)
     in_count = generate_daily_data(int(total_transactions * 0.51), 0.03)
     out_count = total_transactions - in_count
+    in_pct, out_pct = to_percentages(np.array([in_count, out_count]), total_transactions)
     direction_distribution = [
-        DirectionDistributionData(
-            direction='IN',
-            count=in_count,
-            percentage=round((in_count / total_transactions) * 100, 1)
-        ),
-        DirectionDistributionData(
-            direction='OUT',
-            count=out_count,
-            percentage=round((out_count / total_transactions) * 100, 1)
-        )
+        {"direction": 'IN', "count": in_count, "percentage": in_pct},
+        {"direction": 'OUT', "count": out_count, "percentage": out_pct}
     ]
 
     # 4.3 Waktu Perjalanan (Morning vs Evening vs Off-Peak)
-    morning_base = random.randint(1200, 1800)
-    evening_base = random.randint(1200, 1800)
-    off_peak_base = random.randint(600, 1000)
-
+    time_counts = apply_variance(
+        RNG.integers([1200, 1200, 600], [1801, 1801, 1001]), np.array([0.15, 0.15, 0.2])
+    )
     time_travel_distribution = [
-        TimeTravelData(
-            time_segment='Morning (07:00-09:00)',
-            count=generate_daily_data(morning_base, 0.15),
-            percentage=0
-        ),
-        TimeTravelData(
-            time_segment='Evening (16:00-19:00)',
-            count=generate_daily_data(evening_base, 0.15),
-            percentage=0
-        ),
-        TimeTravelData(
-            time_segment='Off-Peak',
-            count=generate_daily_data(off_peak_base, 0.2),
-            percentage=0
+        {"time_segment": time_segment, "count": count, "percentage": pct}
+        for time_segment, count, pct in zip(
+            ('Morning (07:00-09:00)', 'Evening (16:00-19:00)', 'Off-Peak'),
+            time_counts.tolist(), to_percentages(time_counts, total_transactions)
         )
     ]
 
-    # Calculate percentages
-    for tt in time_travel_distribution:
-        tt.percentage = round((tt.count / total_transactions) * 100, 1)
-
     # Summary
-    top_origin = max(origin_distribution, key=lambda x: x.count)
-    dominant_direction = max(direction_distribution, key=lambda x: x.count)
-    dominant_time = max(time_travel_distribution, key=lambda x: x.count)
+    top_origin = origin_distribution[int(station_counts.argmax())]
+    dominant_time = time_travel_distribution[int(time_counts.argmax())]
 
     summary = {
-        "top_origin_station": top_origin.station,
-        "top_origin_count": top_origin.count,
-        "top_origin_percentage": top_origin.percentage,
-        "dominant_direction": dominant_direction.direction,
-        "dominant_time_segment": dominant_time.time_segment,
-        "dominant_time_percentage": dominant_time.percentage
+        "top_origin_station": top_origin["station"],
+        "top_origin_count": top_origin["count"],
+        "top_origin_percentage": top_origin["percentage"],
+        "dominant_direction": 'IN' if in_count >= out_count else 'OUT',
+        "dominant_time_segment": dominant_time["time_segment"],
+        "dominant_time_percentage": dominant_time["percentage"]
     }
 
-    return SegmentasiPerjalananResponse(
-        date=target_date,
-        total_transactions=total_transactions,
-        origin_distribution=origin_distribution,
-        direction_distribution=direction_distribution,
-        time_travel_distribution=time_travel_distribution,
-        summary=summary
-    )
+    return {
+        "date": target_date,
+        "total_transactions": total_transactions,
+        "origin_distribution": origin_distribution,
+        "direction_distribution": direction_distribution,
+        "time_travel_distribution": time_travel_distribution,
+        "summary": summary
+    }
+
+
+@app.get("/api/v1/segmentasi-perjalanan", response_model=None, include_in_schema=False)
+async def get_segmentasi_perjalanan(date: Optional[str] = None):
+    """Kategori 4: Segmentasi Perjalanan"""
+    result = await get_cached("segmentasi-perjalanan", date or get_date(), _build_segmentasi_perjalanan)
+    return ORJSONResponse(result)
 
 
 # ==========================
 # ENDPOINTS - KATEGORI 5: SEGMENTASI LOYALITAS
 # ==========================
 
-@app.get("/api/v1/segmentasi-loyaltas", response_model=SegmentasiLoyaltasResponse, include_in_schema=False)
-async def get_segmentasi_loyaltas(date: Optional[str] = None):
+def _build_segmentasi_loyaltas(target_date: str) -> dict:
     """
     Kategori 5: Segmentasi Loyaltas
     - 5.2 Segmentasi Loyaltas
     - 5.3 Loyaltas berdasarkan Pekerjaan
     """
-    target_date = date or get_date()
-
     # Random daily total passengers
-    total_passengers = random.randint(3500, 5000)
+    total_passengers = int(RNG.integers(3500, 5001))
 
     # 5.2 Segmentasi Loyaltas
-    high_base = random.randint(1200, 1800)
-    medium_base = random.randint(1000, 1500)
-    low_base = random.randint(800, 1200)
-
+    segment_counts = apply_variance(
+        RNG.integers([1200, 1000, 800], [1801, 1501, 1201]), np.array([0.15, 0.15, 0.2])
+    )
     loyalty_segments = [
-        LoyaltySegmentData(
-            segment='High Loyalty (≥12x)',
-            count=generate_daily_data(high_base, 0.15),
-            percentage=0,
-            min_freq=12,
-            max_freq=14
-        ),
-        LoyaltySegmentData(
-            segment='Medium Loyalty (7-11x)',
-            count=generate_daily_data(medium_base, 0.15),
-            percentage=0,
-            min_freq=7,
-            max_freq=11
-        ),
-        LoyaltySegmentData(
-            segment='Low Loyalty (<7x)',
-            count=generate_daily_data(low_base, 0.2),
-            percentage=0,
-            min_freq=1,
-            max_freq=6
+        {"segment": segment, "count": count, "percentage": pct, "min_freq": min_freq, "max_freq": max_freq}
+        for (segment, min_freq, max_freq), count, pct in zip(
+            (('High Loyalty (≥12x)', 12, 14), ('Medium Loyalty (7-11x)', 7, 11), ('Low Loyalty (<7x)', 1, 6)),
+            segment_counts.tolist(), to_percentages(segment_counts, int(segment_counts.sum()))
         )
     ]
 
-    # Calculate percentages
-    total_loyalty = sum(ls.count for ls in loyalty_segments)
-    for ls in loyalty_segments:
-        ls.percentage = round((ls.count / total_loyalty) * 100, 1)
-
     # 5.3 Loyaltas berdasarkan Pekerjaan
-    # Gunakan random.uniform untuk float (avg_frequency)
-    occupations_base = [
-        ('Karyawan Swasta', round(random.uniform(8.0, 10.0), 1), random.randint(1500, 2200)),
-        ('PNS/BUMN', round(random.uniform(8.5, 10.5), 1), random.randint(600, 900)),
-        ('Pelajar/Mahasiswa', round(random.uniform(5.0, 7.0), 1), random.randint(400, 700)),
-        ('Wiraswasta', round(random.uniform(6.0, 8.0), 1), random.randint(500, 800)),
-        ('Wisatawan', round(random.uniform(2.0, 4.0), 1), random.randint(100, 300))
+    # Gunakan RNG.uniform untuk float (avg_frequency)
+    avg_freqs = np.round(
+        np.round(RNG.uniform(_OCCUPATION_FREQ_LOW, _OCCUPATION_FREQ_HIGH), 1)
+        + RNG.uniform(-0.5, 0.5, len(OCCUPATIONS)), 1
+    )
+    occupation_counts = apply_variance(RNG.integers(_OCCUPATION_LOW, _OCCUPATION_HIGH), 0.1)
+    loyalty_by_occupation = [
+        {"occupation": occupation, "avg_frequency": avg_freq, "count": count}
+        for occupation, avg_freq, count in zip(OCCUPATIONS, avg_freqs.tolist(), occupation_counts.tolist())
     ]
-    loyalty_by_occupation = []
-    for occupation, avg_freq, count in occupations_base:
-        loyalty_by_occupation.append(LoyaltyByOccupationData(
-            occupation=occupation,
-            avg_frequency=round(avg_freq + random.uniform(-0.5, 0.5), 1),
-            count=generate_daily_data(count, 0.1)
-        ))
 
     # Summary
-    high_loyalty = next(ls for ls in loyalty_segments if 'High' in ls.segment)
-    loyal_workers = sum(lo.count for lo in loyalty_by_occupation if lo.occupation in ['Karyawan Swasta', 'PNS/BUMN'])
-    most_loyal_occupation = max(loyalty_by_occupation, key=lambda x: x.avg_frequency)
+    high_loyalty = loyalty_segments[0]  # urutan segmen tetap: High, Medium, Low
+    loyal_workers = int(occupation_counts[_WORKER_OCCUPATIONS].sum())
+    most_loyal_occupation = loyalty_by_occupation[int(avg_freqs.argmax())]
 
     summary = {
-        "high_loyalty_count": high_loyalty.count,
-        "high_loyalty_percentage": high_loyalty.percentage,
+        "high_loyalty_count": high_loyalty["count"],
+        "high_loyalty_percentage": high_loyalty["percentage"],
         "loyal_workers_count": loyal_workers,
         "loyal_workers_percentage": round((loyal_workers / total_passengers) * 100, 1),
-        "most_loyal_occupation": most_loyal_occupation.occupation,
-        "most_loyal_occupation_avg_freq": most_loyal_occupation.avg_frequency
+        "most_loyal_occupation": most_loyal_occupation["occupation"],
+        "most_loyal_occupation_avg_freq": most_loyal_occupation["avg_frequency"]
     }
 
-    return SegmentasiLoyaltasResponse(
-        date=target_date,
-        total_passengers=total_passengers,
-        loyalty_segments=loyalty_segments,
-        loyalty_by_occupation=loyalty_by_occupation,
-        summary=summary
-    )
+    return {
+        "date": target_date,
+        "total_passengers": total_passengers,
+        "loyalty_segments": loyalty_segments,
+        "loyalty_by_occupation": loyalty_by_occupation,
+        "summary": summary
+    }
+
+
+@app.get("/api/v1/segmentasi-loyaltas", response_model=None, include_in_schema=False)
+async def get_segmentasi_loyaltas(date: Optional[str] = None):
+    """Kategori 5: Segmentasi Loyaltas"""
+    result = await get_cached("segmentasi-loyaltas", date or get_date(), _build_segmentasi_loyaltas)
+    return ORJSONResponse(result)
 
 
 # ==========================
 # ENDPOINTS - KATEGORI KORELASI BEHAVIOR
 # ==========================
 
-@app.get("/api/v1/behavior-correlation", response_model=BehaviorCorrelationResponse, include_in_schema=False)
-async def get_behavior_correlation(date: Optional[str] = None):
+def _build_behavior_correlation(target_date: str) -> dict:
     """
     Kategori Korelasi Behavior - Analisis hubungan antar variabel
     - 6.1 Usia vs Frekuensi Loyalty
     - 6.2 Distribusi Gender per Jam
     - 6.3 Preferensi Zone berdasarkan Pekerjaan
     """
-    target_date = date or get_date()
-
     # 6.1 Usia vs Frekuensi Loyalty
     # Pola: usia lebih tinggi cenderung lebih loyal
-    age_loyalty_correlation = []
-    age_groups = [
-        (22, 6.5),  # Usia muda (22-28)
-        (28, 7.2),  # Young adult (29-35)
-        (35, 8.5),  # Mid adult (36-45)
-        (45, 9.0),  # Mature (46-55)
-        (55, 7.0)   # Senior (56+)
+    n_groups = _LOYALTY_BASE_FREQ.size
+    age_counts = apply_variance(RNG.integers(400, 801, n_groups), 0.2)
+    age_freqs = np.round(_LOYALTY_BASE_FREQ + RNG.uniform(-1.0, 1.0, n_groups), 1)
+    age_loyalty_correlation = [
+        {"age": age, "avg_loyalty_frequency": avg_freq, "count": count}
+        for age, avg_freq, count in zip(_LOYALTY_AGES, age_freqs.tolist(), age_counts.tolist())
     ]
-    for age, base_freq in age_groups:
-        count = generate_daily_data(random.randint(400, 800), 0.2)
-        avg_freq = round(base_freq + random.uniform(-1.0, 1.0), 1)
-        age_loyalty_correlation.append(AgeLoyaltyCorrelationData(
-            age=age,
-            avg_loyalty_frequency=avg_freq,
-            count=count
-        ))
-
-    
-    hour_gender_distribution = []
-    for hour in range(6, 23):
-    
-        base_count = random.randint(50, 600)
-        if 6 <= hour <= 11:
-            pria_pct = 0.55 + random.uniform(-0.05, 0.05)  # 50-60%
-        elif 16 <= hour <= 19:
-            pria_pct = 0.45 + random.uniform(-0.05, 0.05)  # 40-50%
-        else:
-            pria_pct = 0.50 + random.uniform(-0.05, 0.05)  # ~50%
 
-        total = generate_daily_data(base_count, 0.15)
-        pria_count = int(total * pria_pct)
-        wanita_count = total - pria_count
-
-        hour_gender_distribution.append(HourGenderData(
-            hour=hour,
-            pria_count=pria_count,
-            wanita_count=wanita_count,
-            pria_percentage=round((pria_count / total) * 100, 1),
-            wanita_percentage=round((wanita_count / total) * 100, 1)
-        ))
+    # 6.2 Distribusi Gender per Jam
+    hour_totals = apply_variance(RNG.integers(50, 601, HOURS.size), 0.15)
+    pria_counts = (hour_totals * (_PRIA_BASE + RNG.uniform(-0.05, 0.05, HOURS.size))).astype(np.int64)
+    wanita_counts = hour_totals - pria_counts
+    hour_gender_distribution = [
+        {
+            "hour": hour,
+            "pria_count": pria_count,
+            "wanita_count": wanita_count,
+            "pria_percentage": pria_pct,
+            "wanita_percentage": wanita_pct
+        }
+        for hour, pria_count, wanita_count, pria_pct, wanita_pct in zip(
+            HOURS.tolist(), pria_counts.tolist(), wanita_counts.tolist(),
+            to_percentages(pria_counts, hour_totals), to_percentages(wanita_counts, hour_totals)
+        )
+    ]
 
     # 6.3 Preferensi Zone berdasarkan Pekerjaan
-    # Pola: PNS/BUMN prefer North (dekat kantor), Wisatawan prefer West (dekat area komersial)
-    occupation_zone_base = [
-        ('Karyawan Swasta', 0.52, 0.48),   # Sedikit prefer North
-        ('PNS/BUMN', 0.60, 0.40),        # Jelas prefer North
-        ('Pelajar/Mahasiswa', 0.48, 0.52),  # Sedikit prefer West
-        ('Wiraswasta', 0.50, 0.50),        # Seimbang
-        ('Wisatawan', 0.35, 0.65)         # Prefer West (area komersial)
+    occupation_totals = apply_variance(RNG.integers(200, 1001, len(OCCUPATIONS)), 0.2)
+    north_counts = (occupation_totals * _NORTH_RATIOS).astype(np.int64)
+    west_counts = occupation_totals - north_counts
+    occupation_zone_preference = [
+        {"occupation": occupation, "north_count": north_count, "west_count": west_count, "preference": pref}
+        for occupation, north_count, west_count, pref in zip(
+            OCCUPATIONS, north_counts.tolist(), west_counts.tolist(), OCCUPATION_ZONE_PREFERENCES
+        )
     ]
 
-    occupation_zone_preference = []
-    for occupation, north_ratio, west_ratio in occupation_zone_base:
-        total = generate_daily_data(random.randint(200, 1000), 0.2)
-        north_count = int(total * north_ratio)
-        west_count = total - north_count
-
-        # Tentukan preference
-        if north_ratio > 0.55:
-            pref = 'North'
-        elif west_ratio > 0.55:
-            pref = 'West'
-        else:
-            pref = 'Neutral'
-
-        occupation_zone_preference.append(OccupationZonePreferenceData(
-            occupation=occupation,
-            north_count=north_count,
-            west_count=west_count,
-            preference=pref
-        ))
-
     # Summary
-    # Hitung korelasi usia vs loyalty
-    avg_young_loyalty = sum(item.avg_loyalty_frequency * item.count for item in age_loyalty_correlation[:2])
-    avg_young_count = sum(item.count for item in age_loyalty_correlation[:2])
-    young_avg = avg_young_loyalty / avg_young_count if avg_young_count > 0 else 0
+    # Hitung korelasi usia vs loyalty (rata-rata tertimbang jumlah penumpang)
+    avg_young_count = int(age_counts[:2].sum())
+    young_avg = float(np.dot(age_freqs[:2], age_counts[:2])) / avg_young_count if avg_young_count > 0 else 0
 
-    avg_senior_loyalty = sum(item.avg_loyalty_frequency * item.count for item in age_loyalty_correlation[3:])
-    avg_senior_count = sum(item.count for item in age_loyalty_correlation[3:])
-    senior_avg = avg_senior_loyalty / avg_senior_count if avg_senior_count > 0 else 0
+    avg_senior_count = int(age_counts[3:].sum())
+    senior_avg = float(np.dot(age_freqs[3:], age_counts[3:])) / avg_senior_count if avg_senior_count > 0 else 0
 
     summary = {
         "age_loyalty_insight": "Positif" if senior_avg > young_avg else "Negatif/Netral",
         "young_avg_loyalty": round(young_avg, 1),
         "senior_avg_loyalty": round(senior_avg, 1),
-        "dominant_gender_morning": "Pria" if hour_gender_distribution[1].pria_percentage > 50 else "Wanita",
-        "dominant_gender_evening": "Pria" if hour_gender_distribution[14].pria_percentage > 50 else "Wanita",
-        "strong_zone_preference_count": sum(1 for item in occupation_zone_preference if item.preference != 'Neutral')
+        "dominant_gender_morning": "Pria" if hour_gender_distribution[1]["pria_percentage"] > 50 else "Wanita",
+        "dominant_gender_evening": "Pria" if hour_gender_distribution[14]["pria_percentage"] > 50 else "Wanita",
+        "strong_zone_preference_count": sum(1 for item in occupation_zone_preference if item["preference"] != 'Neutral')
+    }
+
+    return {
+        "date": target_date,
+        "age_loyalty_correlation": age_loyalty_correlation,
+        "hour_gender_distribution": hour_gender_distribution,
+        "occupation_zone_preference": occupation_zone_preference,
+        "summary": summary
     }
 
-    return BehaviorCorrelationResponse(
-        date=target_date,
-        age_loyalty_correlation=age_loyalty_correlation,
-        hour_gender_distribution=hour_gender_distribution,
-        occupation_zone_preference=occupation_zone_preference,
-        summary=summary
-    )
+
+@app.get("/api/v1/behavior-correlation", response_model=None, include_in_schema=False)
+async def get_behavior_correlation(date: Optional[str] = None):
+    """Kategori Korelasi Behavior"""
+    result = await get_cached("behavior-correlation", date or get_date(), _build_behavior_correlation)
+    return ORJSONResponse(result)
 
 
 # ==========================
 # ENDPOINTS - COMBINED DATA
 # ==========================
 
+# Rekomendasi statis (tanpa interpolasi), dibuat sekali saat import
+_OPS_EFF_REKOMENDASI_OPERASI = (
+    "1. Shift petugas dari gate sepi (jam off-peak) ke gate sibuk untuk optimalisasi",
+    "2. Tambah gate darurat saat peak hours untuk mengurangi antrean",
+    "3. Implement queue system baris dengan kapasitas maksimal 200 orang per baris"
+)
+_SEG_PERJ_REKOMENDASI_OPERASIONAL = (
+    "1. Increase KRL frequency saat peak hours (07:00-09:00 dan 16:00-19:00)",
+    "2. Single-journey ticket promo untuk off-peak riders (10:00-16:00 dan 19:00-22:00)",
+    "3. Coordinate dengan stasiun asal untuk thru-ticket promo",
+    "4. Real-time crowding indicator di area tap-in untuk distribusi penumpang"
+)
+_DEMOG_REKOMENDASI_OPERASIONAL = (
+    "1. Zone-based advertising: Promosikan F&B di area NORTH (wanita), retail di area WEST (pria)",
+    "2. Partnership dengan perusahaan di 3 stasiun teratas: Bekasi, Cikarang, Depok",
+    "3. Employee shuttle service untuk penumpang usia produktif pagi-sore",
+    "4. Digital signage berbahasa Indonesia di zona utama"
+)
+_SEG_LOY_REKOMENDASI_OPERASIONAL = (
+    "1. Implement tiered membership: Bronze (Low), Silver (Medium), Gold (High)",
+    "2. Gold members: Priority access, lounge access, 20% retail discount",
+    "3. Silver members: 10% discount, double points promo",
+    "4. Bronze members: Welcome discount, first 3 rides promo points"
+)
+# Item pertama rekomendasi strategis loyaltas diisi pekerjaan paling loyal saat transform
+_SEG_LOY_REKOMENDASI_STRATEGIS = (
+    "Loyalty points redemption di station facilities (F&B, retail)",
+    "Referral bonus: High loyalty members yang berhasil ajak teman dapat bonus points",
+    "Seasonal campaign: Double points pada off-peak hours untuk mengurangi crowd peak"
+)
+_REKOMENDASI_STRATEGIS = (
+    "Morning: Prioritaskan penangan cepat (coffee grab, breakfast set) untuk komuter pagi",
+    "Evening: Focus ke retail & family services (makan malam, grocery) untuk komuter sore",
+    "Off-Peak: Gunakan flash sale & special promo untuk menarik trafik di jam sepi"
+)
+
+_KATEGORI_LABELS = {
+    "efisiensi_operasional": "1️⃣ Operational Efficiency",
+    "demografi": "2️⃣ Profil Demografi",
+    "segmentasi_perjalanan": "3️⃣ Segmentasi Perjalanan",
+    "segmentasi_loyaltas": "4️⃣ Segmentasi Loyaltas",
+    "korelasi_perilaku": "5️⃣ Behavior Correlation"
+}
+
+def build_dashboard_summary(ops_eff_indo: dict, demog_indo: dict, seg_perj_indo: dict, seg_loy_indo: dict) -> dict:
+    """Key metric cards untuk Dashboard Utama; label/deskripsi adalah literal konstan"""
+    ops_ringkasan = ops_eff_indo["ringkasan"]
+    demog_ringkasan = demog_indo["ringkasan"]
+    seg_perj_ringkasan = seg_perj_indo["ringkasan"]
+    seg_loy_ringkasan = seg_loy_indo["ringkasan"]
+    return {
+        "total_transaksi": {
+            "nilai": ops_eff_indo['total_transaksi'],
+            "label": "Total Transaksi",
+            "deskripsi": "Total tap-in dan tap-out hari ini",
+            "delta": "Harian"
+        },
+        "total_penumpang_unik": {
+            "nilai": demog_indo['total_penumpang'],
+            "label": "Total Penumpang Unik",
+            "deskripsi": "Jumlah penumpang unik hari ini",
+            "delta": "Unik"
+        },
+        "high_loyalty_penumpang": {
+            "nilai": f"{seg_loy_ringkasan['persentase_loyal_tinggi']}%",
+            "label": "High Loyalty Penumpang",
+            "deskripsi": "Persentase penumpang loyal (frekuensi ≥12x/minggu)",
+            "delta": "≥12x/minggu",
+            "persentase": seg_loy_ringkasan['persentase_loyal_tinggi']
+        },
+        "gate_tersibuk": {
+            "nilai": ops_ringkasan['gate_tertersibuk'].replace('TAP-', ''),
+            "label": "Gate Tersibuk",
+            "deskripsi": "Gate dengan penggunaan tertinggi hari ini",
+            "delta": "Highest Utilization",
+            "gate_id_full": ops_ringkasan['gate_tertersibuk']
+        },
+        "morning_peak_traffic": {
+            "nilai": f"{ops_ringkasan['persentase_pagi']}%",
+            "label": "Morning Peak Traffic",
+            "deskripsi": "Persentase trafik jam sibuk pagi",
+            "delta": "07:00-09:00",
+            "persentase": ops_ringkasan['persentase_pagi']
+        },
+        "evening_peak_traffic": {
+            "nilai": f"{ops_ringkasan['persentase_sore']}%",
+            "label": "Evening Peak Traffic",
+            "deskripsi": "Persentase trafik jam sibuk sore",
+            "delta": "16:00-19:00",
+            "persentase": ops_ringkasan['persentase_sore']
+        },
+        "rata_rata_usia": {
+            "nilai": f"{demog_ringkasan['rata_usia']} tahun",
+            "label": "Rata-rata Usia",
+            "deskripsi": "Usia rata-rata penumpang",
+            "delta": "Demografi",
+            "usia": demog_ringkasan['rata_usia']
+        },
+        "stasiun_asal_dominan": {
+            "nilai": seg_perj_ringkasan['stasiun_asal_terbanyak'],
+            "label": "Stasiun Asal Dominan",
+            "deskripsi": "Stasiun asal dengan penumpang terbanyak",
+            "delta": f"{seg_perj_ringkasan['persentase_stasiun_asal']}% dari total",
+            "persentase": seg_perj_ringkasan['persentase_stasiun_asal'],
+            "stasiun": seg_perj_ringkasan['stasiun_asal_terbanyak']
+        }
+    }
+
+# Build /all-data yang sedang berjalan per tanggal; request bersamaan menunggu task yang sama
+_all_data_inflight: Dict[str, asyncio.Task] = {}
+
 @app.get("/api/v1/all-data")
 async def get_all_data(date: Optional[str] = None):
     """
@@ -716,27 +863,38 @@ async def get_all_data(date: Optional[str] = None):
     """
     target_date = date or get_date()
 
-    # Fetch semua data
-    ops_eff_raw = await get_operational_efficiency(target_date)
-    demog_raw = await get_demografi(target_date)
-    seg_perj_raw = await get_segmentasi_perjalanan(target_date)
-    seg_loy_raw = await get_segmentasi_loyaltas(target_date)
-    beh_corr_raw = await get_behavior_correlation(target_date)
-
-    # Convert ke dict lalu transform keys ke bahasa Indonesia
-    ops_eff = ops_eff_raw.model_dump()
-    demog = demog_raw.model_dump()
-    seg_perj = seg_perj_raw.model_dump()
-    seg_loy = seg_loy_raw.model_dump()
-    beh_corr = beh_corr_raw.model_dump()
+    cached = _all_data_cache.get(target_date)
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL_SECONDS:
+        return Response(content=cached[1], media_type="application/json")
+
+    task = _all_data_inflight.get(target_date)
+    if task is None:
+        task = asyncio.ensure_future(_build_all_data(target_date))
+        _all_data_inflight[target_date] = task
+        task.add_done_callback(lambda _: _all_data_inflight.pop(target_date, None))
+
+    # shield: client yang disconnect tidak membatalkan build milik request lain
+    body = await asyncio.shield(task)
+    return Response(content=body, media_type="application/json")
+
+async def _build_all_data(target_date: str) -> bytes:
+    """Fetch, transform and encode the /all-data body for one date, then cache it"""
+    # Fetch semua data secara bersamaan (tiap build jalan di threadpool)
+    ops_eff, demog, seg_perj, seg_loy, beh_corr = await asyncio.gather(
+        get_cached("operational-efficiency", target_date, _build_operational_efficiency),
+        get_cached("demografi", target_date, _build_demografi),
+        get_cached("segmentasi-perjalanan", target_date, _build_segmentasi_perjalanan),
+        get_cached("segmentasi-loyaltas", target_date, _build_segmentasi_loyaltas),
+        get_cached("behavior-correlation", target_date, _build_behavior_correlation)
+    )
 
     
     def transform_ops_eff_keys(data):
-        
+        summary = data["summary"]
         total_transaksi = data["total_transactions"]
-        morning_pct = data["summary"]["morning_peak_percentage"]
-        evening_pct = data["summary"]["evening_peak_percentage"]
-        avg_util = data["summary"]["avg_gate_utilization_rate"]
+        morning_pct = summary["morning_peak_percentage"]
+        evening_pct = summary["evening_peak_percentage"]
+        avg_util = summary["avg_gate_utilization_rate"]
 
         # Identify traffic pattern
         if morning_pct > 35:
@@ -746,10 +904,18 @@ async def get_all_data(date: Optional[str] = None):
         else:
             pola_trafik = "neutral"
 
-        # Gate balance analysis
-        gate_utils = [g["utilization_rate"] for g in data["gate_utilization"]]
-        min_util = min(gate_utils)
-        max_util = max(gate_utils)
+        # Gate balance analysis (min/max dan baris penggunaan_gate dalam satu pass)
+        min_util = float("inf")
+        max_util = float("-inf")
+        penggunaan_gate = []
+        for g in data["gate_utilization"]:
+            u = g["utilization_rate"]
+            if u < min_util:
+                min_util = u
+            if u > max_util:
+                max_util = u
+            penggunaan_gate.append({"gate_id": g["gate_id"], "zona": g["zone"], "jumlah": g["count"],
+                                    "tingkat_utilisasi": u})
         selisih_util = max_util - min_util
 
         if selisih_util > 15:
@@ -775,11 +941,7 @@ async def get_all_data(date: Optional[str] = None):
                 {"jam": t["hour"], "jumlah": t["count"], "periode": t["period"]}
                 for t in data["traffic_per_hour"]
             ],
-            "penggunaan_gate": [
-                {"gate_id": g["gate_id"], "zona": g["zone"], "jumlah": g["count"],
-                 "tingkat_utilisasi": g["utilization_rate"]}
-                for g in data["gate_utilization"]
-            ],
+            "penggunaan_gate": penggunaan_gate,
             "trafik_per_zona": [
                 {"zona": z["zone"], "jumlah": z["count"], "persentase": z["percentage"]}
                 for z in data["traffic_by_zone"]
@@ -790,13 +952,13 @@ async def get_all_data(date: Optional[str] = None):
                 for b in data["balance_direction"]
             ],
             "ringkasan": {
-                "transaksi_pagi": data["summary"]["morning_peak_transactions"],
-                "persentase_pagi": data["summary"]["morning_peak_percentage"],
-                "transaksi_sore": data["summary"]["evening_peak_transactions"],
-                "persentase_sore": data["summary"]["evening_peak_percentage"],
-                "rata_utilisasi_gate": data["summary"]["avg_gate_utilization_rate"],
-                "gate_tertersibuk": data["summary"]["busiest_gate"],
-                "zona_tertersibuk": data["summary"]["busiest_zone"]
+                "transaksi_pagi": summary["morning_peak_transactions"],
+                "persentase_pagi": summary["morning_peak_percentage"],
+                "transaksi_sore": summary["evening_peak_transactions"],
+                "persentase_sore": summary["evening_peak_percentage"],
+                "rata_utilisasi_gate": summary["avg_gate_utilization_rate"],
+                "gate_tertersibuk": summary["busiest_gate"],
+                "zona_tertersibuk": summary["busiest_zone"]
             },
             "insight_ai": {
                 "pola_trafik": pola_trafik,
@@ -805,22 +967,15 @@ async def get_all_data(date: Optional[str] = None):
                 "rekomendasi_optimalisasi": rekomendasi_gate,
                 "analisis_detail": f"Trafik pagi {morning_pct:.1f}% dan sore {evening_pct:.1f}% dari total transaksi. Rata-rata utilisasi gate {avg_util:.1f}%. {rekomendasi_gate}"
             },
-            "rekomendasi_operasi": [
-                f"1. Shift petugas dari gate sepi (jam off-peak) ke gate sibuk untuk optimalisasi",
-                f"2. Tambah gate darurat saat peak hours untuk mengurangi antrean",
-                f"3. Implement queue system baris dengan kapasitas maksimal 200 orang per baris"
-            ],
-            "rekomendasi_strategis": [
-                f"Morning: Prioritaskan penangan cepat (coffee grab, breakfast set) untuk komuter pagi",
-                f"Evening: Focus ke retail & family services (makan malam, grocery) untuk komuter sore",
-                f"Off-Peak: Gunakan flash sale & special promo untuk menarik trafik di jam sepi"
-            ]
+            "rekomendasi_operasi": _OPS_EFF_REKOMENDASI_OPERASI,
+            "rekomendasi_strategis": _REKOMENDASI_STRATEGIS
         }
 
     def transform_demog_keys(data):
         # AI Insights: Analisis demografi penumpang yang lebih actionable
-        productive_pct = data["summary"]["productive_age_percentage"]
-        worker_pct = data["summary"]["worker_percentage"]
+        summary = data["summary"]
+        productive_pct = summary["productive_age_percentage"]
+        worker_pct = summary["worker_percentage"]
 
         # Segmentasi pasar utama
         if productive_pct > 60:
@@ -831,18 +986,18 @@ async def get_all_data(date: Optional[str] = None):
             segmen_pasar_utama = "Campuran Beragam"
 
         # Rasio gender
-        gender_data = data["gender_distribution"]
-        pria_pct = next(g["percentage"] for g in gender_data if g["gender"] == "Pria")
-        wanita_pct = next(g["percentage"] for g in gender_data if g["gender"] == "Wanita")
+        gender_idx = {g["gender"]: g["percentage"] for g in data["gender_distribution"]}
+        pria_pct = gender_idx.get("Pria", 0.0)
+        wanita_pct = gender_idx.get("Wanita", 0.0)
         rasio_gender = "Seimbang" if abs(pria_pct - wanita_pct) < 10 else ("Pria Dominan" if pria_pct > wanita_pct else "Wanita Dominan")
 
         # Stasiun asal utama
         origin_stations = data["origin_station_distribution"]
-        top_3_stations = sorted(origin_stations, key=lambda x: x["count"], reverse=True)[:3]
+        top_3_stations = heapq.nlargest(3, origin_stations, key=lambda x: x["count"])
         stasiun_prioritas = ", ".join([s["station"] for s in top_3_stations])
 
         # Rasio usia produktif vs non-produktif
-        productive_count = data["summary"]["productive_age_passengers"]
+        productive_count = summary["productive_age_passengers"]
         non_productive = data["total_passengers"] - productive_count
         rasio_usia = (productive_count / non_productive * 100) if non_productive > 0 else 0
 
@@ -866,42 +1021,40 @@ async def get_all_data(date: Optional[str] = None):
                 for s in data["origin_station_distribution"]
             ],
             "ringkasan": {
-                "rata_usia": data["summary"]["average_age"],
-                "penumpang_usia_produktif": data["summary"]["productive_age_passengers"],
-                "persentase_usia_produktif": data["summary"]["productive_age_percentage"],
-                "penumpang_pekerja": data["summary"]["worker_passengers"],
-                "persentase_pekerja": data["summary"]["worker_percentage"],
-                "stasiun_asal_dominan": data["summary"]["dominant_origin_station"]
+                "rata_usia": summary["average_age"],
+                "penumpang_usia_produktif": summary["productive_age_passengers"],
+                "persentase_usia_produktif": summary["productive_age_percentage"],
+                "penumpang_pekerja": summary["worker_passengers"],
+                "persentase_pekerja": summary["worker_percentage"],
+                "stasiun_asal_dominan": summary["dominant_origin_station"]
             },
             "insight_ai": {
-                "profil_penumpang": f"Rata-rata {data['summary']['average_age']:.1f} tahun dengan {productive_pct:.0f}% usia produktif (25-45 tahun)",
+                "profil_penumpang": f"Rata-rata {summary['average_age']:.1f} tahun dengan {productive_pct:.0f}% usia produktif (25-45 tahun)",
                 "rasio_demografi": f"{rasio_gender} - {pria_pct:.0f}% pria vs {wanita_pct:.0f}% wanita",
                 "stasiun_prioritas": stasiun_prioritas,
                 "analisis_peluang": f"Rasio usia produktif vs non-produktif {rasio_usia:.0f}% menunjukkan potensi revenue yang tinggi",
                 "target_promosi_utama": f"1. F&B: {wanita_pct:.0f}% (target: wanita pekerja & keluarga), 2. Retail: {pria_pct:.0f}% (target: pria pekerja), 3. Services: {worker_pct:.0f}% (target: PNS/BUMN)",
                 "fasilitas_prioritas": f"Toilet/musholla perlu dialokasi berdasarkan dominasi gender di setiap zona"
             },
-            "rekomendasi_operasional": [
-                "1. Zone-based advertising: Promosikan F&B di area NORTH (wanita), retail di area WEST (pria)",
-                "2. Partnership dengan perusahaan di 3 stasiun teratas: Bekasi, Cikarang, Depok",
-                "3. Employee shuttle service untuk penumpang usia produktif pagi-sore",
-                "4. Digital signage berbahasa Indonesia di zona utama"
-            ]
+            "rekomendasi_operasional": _DEMOG_REKOMENDASI_OPERASIONAL
         }
 
     def transform_seg_perj_keys(data):
         # AI Insights: Analisis pola perjalanan penumpang yang lebih actionable
-        dir_data = data["direction_distribution"]
-        in_pct = next(d["percentage"] for d in dir_data if d["direction"] == "IN")
-        out_pct = next(d["percentage"] for d in dir_data if d["direction"] == "OUT")
+        summary = data["summary"]
+        dir_idx = {d["direction"]: d["percentage"] for d in data["direction_distribution"]}
+        in_pct = dir_idx.get("IN", 0.0)
+        out_pct = dir_idx.get("OUT", 0.0)
 
+        # Label segmen waktu diawali kata kunci: "Morning (07:00-09:00)", "Evening (...)", "Off-Peak"
         time_data = data["time_travel_distribution"]
-        morning_pct = next(t["percentage"] for t in time_data if "Morning" in t["time_segment"])
-        evening_pct = next(t["percentage"] for t in time_data if "Evening" in t["time_segment"])
+        time_idx = {t["time_segment"].split(" ", 1)[0]: t["percentage"] for t in time_data}
+        morning_pct = time_idx.get("Morning", 0.0)
+        evening_pct = time_idx.get("Evening", 0.0)
 
         # Rekomendasi stasiun
         origin_stations = data["origin_distribution"]
-        top_stations = sorted(origin_stations, key=lambda x: x["count"], reverse=True)[:3]
+        top_stations = heapq.nlargest(3, origin_stations, key=lambda x: x["count"])
 
         return {
             "tanggal": data["date"],
@@ -919,12 +1072,12 @@ async def get_all_data(date: Optional[str] = None):
                 for t in data["time_travel_distribution"]
             ],
             "ringkasan": {
-                "stasiun_asal_terbanyak": data["summary"]["top_origin_station"],
-                "jumlah_stasiun_asal": data["summary"]["top_origin_count"],
-                "persentase_stasiun_asal": data["summary"]["top_origin_percentage"],
-                "arah_dominan": data["summary"]["dominant_direction"],
-                "segmen_waktu_dominan": data["summary"]["dominant_time_segment"],
-                "persentase_waktu_dominan": data["summary"]["dominant_time_percentage"]
+                "stasiun_asal_terbanyak": summary["top_origin_station"],
+                "jumlah_stasiun_asal": summary["top_origin_count"],
+                "persentase_stasiun_asal": summary["top_origin_percentage"],
+                "arah_dominan": summary["dominant_direction"],
+                "segmen_waktu_dominan": summary["dominant_time_segment"],
+                "persentase_waktu_dominan": summary["dominant_time_percentage"]
             },
             "insight_ai": {
                 "pola_perjalanan": f"Pola perjalanan: {in_pct:.1f}% IN, {out_pct:.1f}% OUT. Waktu dominan: {time_data[0]['time_segment'] if time_data else 'N/A'}",
@@ -932,25 +1085,16 @@ async def get_all_data(date: Optional[str] = None):
                 "rekomendasi_kapasitas": f"Kapasitas KRL saat peak: ~200-250 penumpang per 5 menit. Pertimbangkan tambah 1-2 KRL saat peak hours",
                 "analisis_origin": f"Top 3 stasiun asal: {', '.join([s['station'] for s in top_stations])} menyumbang {sum(s['count'] for s in top_stations)} transaksi"
             },
-            "rekomendasi_operasional": [
-                f"1. Increase KRL frequency saat peak hours (07:00-09:00 dan 16:00-19:00)",
-                f"2. Single-journey ticket promo untuk off-peak riders (10:00-16:00 dan 19:00-22:00)",
-                f"3. Coordinate dengan stasiun asal untuk thru-ticket promo",
-                f"4. Real-time crowding indicator di area tap-in untuk distribusi penumpang"
-            ],
-            "rekomendasi_strategis": [
-                f"Morning: Prioritaskan penangan cepat (coffee grab, breakfast set) untuk komuter pagi",
-                f"Evening: Focus ke retail & family services (makan malam, grocery) untuk komuter sore",
-                f"Off-Peak: Gunakan flash sale & special promo untuk menarik trafik di jam sepi"
-            ]
+            "rekomendasi_operasional": _SEG_PERJ_REKOMENDASI_OPERASIONAL,
+            "rekomendasi_strategis": _REKOMENDASI_STRATEGIS
         }
 
     def transform_seg_loy_keys(data):
         # AI Insights: Analisis segmentasi loyalitas penumpang
-        seg_data = data["loyalty_segments"]
-        high_seg = next(s for s in seg_data if "High" in s["segment"])
-        med_seg = next(s for s in seg_data if "Medium" in s["segment"])
-        low_seg = next(s for s in seg_data if "Low" in s["segment"])
+        summary = data["summary"]
+        # Label segmen diawali level: "High Loyalty (≥12x)", "Medium ...", "Low ..."
+        seg_idx = {s["segment"].split(" ", 1)[0]: s for s in data["loyalty_segments"]}
+        high_seg, med_seg, low_seg = seg_idx["High"], seg_idx["Medium"], seg_idx["Low"]
 
         high_loy = high_seg["percentage"]
         med_loy = med_seg["percentage"]
@@ -998,8 +1142,8 @@ async def get_all_data(date: Optional[str] = None):
                 "jumlah_loyal_tinggi": high_count,
                 "jumlah_loyal_sedang": med_count,
                 "jumlah_loyal_rendah": low_count,
-                "pekerjaan_paling_loyal": data["summary"]["most_loyal_occupation"],
-                "frekuensi_loyal_tertinggi": data["summary"]["most_loyal_occupation_avg_freq"]
+                "pekerjaan_paling_loyal": summary["most_loyal_occupation"],
+                "frekuensi_loyal_tertinggi": summary["most_loyal_occupation_avg_freq"]
             },
             "insight_ai": {
                 "strategi_loyal": strategi_loyal,
@@ -1009,38 +1153,41 @@ async def get_all_data(date: Optional[str] = None):
                 "rekomendasi_medium": f"Upgrade program: Target {med_count} penumpang Medium untuk naik ke High tier",
                 "rekomendasi_low": f"Acquisition campaign: Target {low_count} penumpang Low dengan first-time promo & welcome discount"
             },
-            "rekomendasi_operasional": [
-                f"1. Implement tiered membership: Bronze (Low), Silver (Medium), Gold (High)",
-                f"2. Gold members: Priority access, lounge access, 20% retail discount",
-                f"3. Silver members: 10% discount, double points promo",
-                f"4. Bronze members: Welcome discount, first 3 rides promo points"
-            ],
-            "rekomendasi_strategis": [
+            "rekomendasi_operasional": _SEG_LOY_REKOMENDASI_OPERASIONAL,
+            "rekomendasi_strategis": (
                 f"Partnership B2B dengan perusahaan dominan ({most_loyal_occ}) untuk bulk loyalty program",
-                f"Loyalty points redemption di station facilities (F&B, retail)",
-                f"Referral bonus: High loyalty members yang berhasil ajak teman dapat bonus points",
-                f"Seasonal campaign: Double points pada off-peak hours untuk mengurangi crowd peak"
-            ]
+                *_SEG_LOY_REKOMENDASI_STRATEGIS
+            )
         }
 
     def transform_beh_corr_keys(data):
         # AI Insights: Analisis korelasi perilaku penumpang
-        age_data = data["age_loyalty_correlation"]
-        young_avg = sum(a["avg_loyalty_frequency"] for a in age_data if a["age"] < 30) / len([a for a in age_data if a["age"] < 30])
-        senior_avg = sum(a["avg_loyalty_frequency"] for a in age_data if a["age"] >= 45) / len([a for a in age_data if a["age"] >= 45])
+        summary = data["summary"]
+        young_sum = senior_sum = 0.0
+        young_n = senior_n = 0
+        for a in data["age_loyalty_correlation"]:
+            age = a["age"]
+            if age < 30:
+                young_sum += a["avg_loyalty_frequency"]
+                young_n += 1
+            elif age >= 45:
+                senior_sum += a["avg_loyalty_frequency"]
+                senior_n += 1
+        young_avg = young_sum / young_n if young_n else 0.0
+        senior_avg = senior_sum / senior_n if senior_n else 0.0
         korelasi_usia = "Positif" if senior_avg > young_avg else ("Negatif" if abs(senior_avg - young_avg) > 0.5 else "Netral")
 
         # Gender pattern per jam
-        hour_gender = data["hour_gender_distribution"]
-        morning_hours = [h for h in hour_gender if 6 <= h["hour"] <= 11]
-        evening_hours = [h for h in hour_gender if 16 <= h["hour"] <= 19]
-
-        morning_pria = sum(h["pria_count"] for h in morning_hours)
-        morning_wanita = sum(h["wanita_count"] for h in morning_hours)
+        morning_pria = morning_wanita = evening_pria = evening_wanita = 0
+        for h in data["hour_gender_distribution"]:
+            bucket = _HOUR_BUCKET[h["hour"]]
+            if bucket == "morning":
+                morning_pria += h["pria_count"]
+                morning_wanita += h["wanita_count"]
+            elif bucket == "evening":
+                evening_pria += h["pria_count"]
+                evening_wanita += h["wanita_count"]
         morning_gender_dom = "Pria" if morning_pria > morning_wanita else "Wanita"
-
-        evening_pria = sum(h["pria_count"] for h in evening_hours)
-        evening_wanita = sum(h["wanita_count"] for h in evening_hours)
         evening_gender_dom = "Wanita" if evening_wanita > evening_pria else "Pria"
 
         # Zone preference analysis
@@ -1068,12 +1215,12 @@ async def get_all_data(date: Optional[str] = None):
                 for o in data["occupation_zone_preference"]
             ],
             "ringkasan": {
-                "insight_korelasi_usia_loyal": data["summary"]["age_loyalty_insight"],
-                "rata_loyal_muda": data["summary"]["young_avg_loyalty"],
-                "rata_loyal_senior": data["summary"]["senior_avg_loyalty"],
-                "gender_dominan_pagi": data["summary"]["dominant_gender_morning"],
-                "gender_dominan_sore": data["summary"]["dominant_gender_evening"],
-                "jumlah_preferensi_zona_kuat": data["summary"]["strong_zone_preference_count"]
+                "insight_korelasi_usia_loyal": summary["age_loyalty_insight"],
+                "rata_loyal_muda": summary["young_avg_loyalty"],
+                "rata_loyal_senior": summary["senior_avg_loyalty"],
+                "gender_dominan_pagi": summary["dominant_gender_morning"],
+                "gender_dominan_sore": summary["dominant_gender_evening"],
+                "jumlah_preferensi_zona_kuat": summary["strong_zone_preference_count"]
             },
             "insight_ai": {
                 "korelasi_usia": korelasi_usia,
@@ -1093,103 +1240,67 @@ async def get_all_data(date: Optional[str] = None):
             }
         }
 
-    # Transform semua data ke bahasa Indonesia
-    ops_eff_indo = transform_ops_eff_keys(ops_eff)
-    demog_indo = transform_demog_keys(demog)
-    seg_perj_indo = transform_seg_perj_keys(seg_perj)
-    seg_loy_indo = transform_seg_loy_keys(seg_loy)
-    beh_corr_indo = transform_beh_corr_keys(beh_corr)
+    # Jalan di threadpool: hanya boleh membaca argumen lokal. Cache modul (_cache,
+    # _all_data_cache) hanya disentuh di event loop, sehingga build untuk tanggal
+    # berbeda yang berjalan paralel di thread tidak saling balapan.
+    def transform_and_encode() -> bytes:
+        """Transform the five sections to Indonesian keys and encode the /all-data body"""
+        ops_eff_indo = transform_ops_eff_keys(ops_eff)
+        demog_indo = transform_demog_keys(demog)
+        seg_perj_indo = transform_seg_perj_keys(seg_perj)
+        seg_loy_indo = transform_seg_loy_keys(seg_loy)
+        beh_corr_indo = transform_beh_corr_keys(beh_corr)
+
+        # Dashboard Summary - Key metrics untuk Dashboard Utama
+        dashboard_summary = build_dashboard_summary(ops_eff_indo, demog_indo, seg_perj_indo, seg_loy_indo)
+
+        return orjson.dumps({
+            "tanggal": target_date,
+            "dashboard_summary": dashboard_summary,
+            "kategori": _KATEGORI_LABELS,
+            "data": {
+                "efisiensi_operasional": ops_eff_indo,
+                "demografi": demog_indo,
+                "segmentasi_perjalanan": seg_perj_indo,
+                "segmentasi_loyaltas": seg_loy_indo,
+                "korelasi_perilaku": beh_corr_indo
+            }
+        })
 
-    # Dashboard Summary - Key metrics untuk Dashboard Utama
-    dashboard_summary = {
-        "total_transaksi": {
-            "nilai": ops_eff_indo['total_transaksi'],
-            "label": "Total Transaksi",
-            "deskripsi": "Total tap-in dan tap-out hari ini",
-            "delta": "Harian"
-        },
-        "total_penumpang_unik": {
-            "nilai": demog_indo['total_penumpang'],
-            "label": "Total Penumpang Unik",
-            "deskripsi": "Jumlah penumpang unik hari ini",
-            "delta": "Unik"
-        },
-        "high_loyalty_penumpang": {
-            "nilai": f"{seg_loy_indo['ringkasan']['persentase_loyal_tinggi']}%",
-            "label": "High Loyalty Penumpang",
-            "deskripsi": "Persentase penumpang loyal (frekuensi ≥12x/minggu)",
-            "delta": "≥12x/minggu",
-            "persentase": seg_loy_indo['ringkasan']['persentase_loyal_tinggi']
-        },
-        "gate_tersibuk": {
-            "nilai": ops_eff_indo['ringkasan']['gate_tertersibuk'].replace('TAP-', ''),
-            "label": "Gate Tersibuk",
-            "deskripsi": "Gate dengan penggunaan tertinggi hari ini",
-            "delta": "Highest Utilization",
-            "gate_id_full": ops_eff_indo['ringkasan']['gate_tertersibuk']
-        },
-        "morning_peak_traffic": {
-            "nilai": f"{ops_eff_indo['ringkasan']['persentase_pagi']}%",
-            "label": "Morning Peak Traffic",
-            "deskripsi": "Persentase trafik jam sibuk pagi",
-            "delta": "07:00-09:00",
-            "persentase": ops_eff_indo['ringkasan']['persentase_pagi']
-        },
-        "evening_peak_traffic": {
-            "nilai": f"{ops_eff_indo['ringkasan']['persentase_sore']}%",
-            "label": "Evening Peak Traffic",
-            "deskripsi": "Persentase trafik jam sibuk sore",
-            "delta": "16:00-19:00",
-            "persentase": ops_eff_indo['ringkasan']['persentase_sore']
-        },
-        "rata_rata_usia": {
-            "nilai": f"{demog_indo['ringkasan']['rata_usia']} tahun",
-            "label": "Rata-rata Usia",
-            "deskripsi": "Usia rata-rata penumpang",
-            "delta": "Demografi",
-            "usia": demog_indo['ringkasan']['rata_usia']
-        },
-        "stasiun_asal_dominan": {
-            "nilai": seg_perj_indo['ringkasan']['stasiun_asal_terbanyak'],
-            "label": "Stasiun Asal Dominan",
-            "deskripsi": "Stasiun asal dengan penumpang terbanyak",
-            "delta": f"{seg_perj_indo['ringkasan']['persentase_stasiun_asal']}% dari total",
-            "persentase": seg_perj_indo['ringkasan']['persentase_stasiun_asal'],
-            "stasiun": seg_perj_indo['ringkasan']['stasiun_asal_terbanyak']
-        }
-    }
+    # Transform + encode di threadpool agar event loop tetap bebas
+    body = await anyio.to_thread.run_sync(transform_and_encode)
+    now = time.monotonic()
+    _all_data_cache.pop(target_date, None)  # insert ulang di akhir agar urutan dict tetap urutan umur
+    if len(_all_data_cache) >= CACHE_MAX_ENTRIES:
+        _evict_expired(_all_data_cache, now)
+    _all_data_cache[target_date] = (now, body)
+    return body
 
-    return {
-        "tanggal": target_date,
-        "dashboard_summary": dashboard_summary,
-        "kategori": {
-            "efisiensi_operasional": "1️⃣ Operational Efficiency",
-            "demografi": "2️⃣ Profil Demografi",
-            "segmentasi_perjalanan": "3️⃣ Segmentasi Perjalanan",
-            "segmentasi_loyaltas": "4️⃣ Segmentasi Loyaltas",
-            "korelasi_perilaku": "5️⃣ Behavior Correlation"
-        },
-        "data": {
-            "efisiensi_operasional": ops_eff_indo,
-            "demografi": demog_indo,
-            "segmentasi_perjalanan": seg_perj_indo,
-            "segmentasi_loyaltas": seg_loy_indo,
-            "korelasi_perilaku": beh_corr_indo
-        }
-    }
 
 
+_health_cache = [b"", 0.0]  # [body JSON, berlaku sampai (epoch detik)]
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {
-        "status": "aman cuyy",
-        "service": "KCI i love you",
-        "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
-    }
+    """Health check endpoint, body (dengan timestamp) di-encode ulang paling banyak sekali per detik"""
+    now = time.time()
+    if now >= _health_cache[1]:
+        _health_cache[0] = orjson.dumps({
+            "status": "aman cuyy",
+            "service": "KCI i love you",
+            "version": "1.0.0",
+            "timestamp": datetime.fromtimestamp(now).isoformat()
+        })
+        _health_cache[1] = now + 1.0
+    return Response(content=_health_cache[0], media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, port=8004)
+    # uvloop + httptools dari uvicorn[standard]; gagal saat start jika tidak terpasang
+    uvicorn.run(
+        "backend:app",
+        port=8004,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    )
@@ -0,0 +1,11 @@
+# Konfigurasi Gunicorn untuk produksi, dibaca otomatis oleh:
+#   gunicorn backend:app
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('APP_PORT', '8004')}"
+
+# Generator data CPU-bound, jadi satu worker per core agar tidak tertahan GIL
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = 30